@@ -1,22 +1,57 @@
 import random
+import sys
 import yaml
+try:
+    # Parser C da libyaml, bem mais rápido que o carregador puro-Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+import numpy as np
+from numba import njit
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from sortedcontainers import SortedDict
 
-@dataclass
+# Tamanho do lote de números pseudo-aleatórios gerados por chamada compilada
+TAMANHO_LOTE_ALEATORIO = 1024
+
+# Tipos de evento como constantes inteiras: o agendador só compara chaves
+# float e o despacho compara ints, sem custo de comparação de strings
+CHEGADA = 0
+PARTIDA = 1
+
+@njit(cache=True)
+def _lcg_batch(seed, a, c, mask, inv_M, out):
+    """
+    Preenche o buffer `out` com números pseudo-aleatórios em [0, 1) usando o
+    método linear congruente e retorna o estado final do gerador.
+    Como M é potência de dois, o módulo vira um AND com a máscara M-1 e a
+    divisão vira uma multiplicação por 1/M.
+    Compilado com Numba para eliminar o custo do interpretador por chamada.
+    """
+    anterior = seed
+    for i in range(out.shape[0]):
+        anterior = (a * anterior + c) & mask
+        out[i] = anterior * inv_M
+    return anterior
+
+@dataclass(slots=True)
 class Cliente:
     """
     Classe que representa um cliente no sistema.
+    slots=True elimina o __dict__ por instância, reduzindo a memória de
+    cada cliente aos quatro campos declarados.
     id: identificador único do cliente
     tempo_chegada: momento em que o cliente chegou à fila atual
-    fila_atual: nome da fila onde o cliente está
-    proxima_fila: nome da próxima fila para onde o cliente será direcionado (se houver)
+    fila_atual: índice da fila onde o cliente está
+    proxima_fila: índice da próxima fila para onde o cliente será direcionado (se houver)
     """
     id: int
     tempo_chegada: float
-    fila_atual: str
-    proxima_fila: Optional[str] = None
+    fila_atual: int
+    proxima_fila: Optional[int] = None
 
 class GeradorAleatorio:
     """
@@ -28,21 +63,33 @@ class GeradorAleatorio:
         self.a = a
         self.c = c
         self.M = M
-    
+        # M é potência de dois: módulo e divisão viram máscara e multiplicação
+        self.mask = M - 1
+        self.inv_M = 1.0 / M
+        # Buffer de números gerados em lote pelo kernel compilado
+        self._buf = np.empty(TAMANHO_LOTE_ALEATORIO, dtype=np.float64)
+        self._idx = TAMANHO_LOTE_ALEATORIO
+
     def ProximoAleatorio(self):
         """
         Gera o próximo número pseudo-aleatório usando o método linear congruente.
+        Os números são gerados em lotes de TAMANHO_LOTE_ALEATORIO pelo kernel
+        compilado e servidos a partir do buffer.
         Retorna um número entre 0 e 1.
         """
-        self.anterior = (self.a * self.anterior + self.c) % self.M
-        return self.anterior / self.M if self.M != 0 else 0
+        if self._idx >= TAMANHO_LOTE_ALEATORIO:
+            self.anterior = _lcg_batch(self.anterior, self.a, self.c, self.mask, self.inv_M, self._buf)
+            self._idx = 0
+        valor = self._buf[self._idx]
+        self._idx += 1
+        return valor
 
 class Fila:
     """
     Classe que representa uma fila no sistema.
     Gerencia o estado da fila, incluindo servidores, clientes em espera e estatísticas.
     """
-    def __init__(self, nome: str, config: dict):
+    def __init__(self, nome: str, config: dict, gerador: GeradorAleatorio):
         self.nome = nome
         self.tipo = config['type']
         # Extrai o número de servidores do tipo da fila (ex: G/G/2/5 -> 2 servidores)
@@ -57,93 +104,161 @@ class Fila:
         self.tempo_servico_min = config['service']['min']
         self.tempo_servico_max = config['service']['max']
         
+        # Valores derivados pré-computados para evitar aritmética repetida
+        # nos geradores de tempo chamados a cada evento
+        self.faixa_servico = self.tempo_servico_max - self.tempo_servico_min
+        self.faixa_chegada = self.tempo_chegada_max - self.tempo_chegada_min
+        self.tem_chegadas = self.tempo_chegada_min > 0 or self.tempo_chegada_max > 0
+
         # Configuração do roteamento (para qual fila os clientes irão após o serviço)
         self.roteamento = config.get('routing', [])
+        # Tabela de roteamento pré-computada: lista de destinos e CDF das
+        # probabilidades, construídas uma única vez. O sorteio do destino
+        # vira uma busca binária na CDF; probabilidade restante (CDF < 1)
+        # significa sair do sistema.
+        destinos = []
+        probabilidades = []
+        for opcao in self.roteamento:
+            destino, probabilidade = next(iter(opcao.items()))
+            destinos.append(destino)
+            probabilidades.append(probabilidade)
+        # Nomes do YAML; o simulador os resolve para índices de fila
+        self.destinos_roteamento: List = destinos
+        self.cdf_roteamento = np.cumsum(probabilidades)
         
         # Estado da fila
-        self.fila: List[Cliente] = []  # Lista de clientes em espera
+        self.fila: deque = deque()  # Clientes em espera, FIFO com popleft O(1)
         self.servidores: List[Tuple[Optional[Cliente], float]] = [(None, 0)] * self.num_servidores
+        self.ocupados = 0  # Número de servidores ocupados, mantido incrementalmente
+        self.livres: List[int] = list(range(self.num_servidores))  # Pilha de índices de servidores livres
         self.clientes_perdidos = 0
-        self.tempo_em_estado = defaultdict(float)  # Tempo acumulado em cada estado
+        # Tempo acumulado em cada estado; o estado é limitado por
+        # capacidade + servidores, então um vetor de tamanho fixo basta
+        # (1024 cobre o caso de capacidade infinita)
+        max_estados = (int(self.capacidade) if self.capacidade != float('inf') else 1024) + self.num_servidores + 1
+        self.tempo_em_estado = np.zeros(max_estados, dtype=np.float64)
+        # Estados além do vetor (fila sem capacidade que cresce além de
+        # 1024) são contados no último índice
+        self.estado_maximo = max_estados - 1
         self.ultimo_tempo_evento = 0
-        self.gerador = GeradorAleatorio()
+        # Gerador compartilhado por toda a rede: um único fluxo bem semeado
+        # evita que filas distintas reproduzam a mesma sequência
+        self.gerador = gerador
 
     def gerar_tempo_servico(self) -> float:
         """
         Gera um tempo de serviço aleatório entre o mínimo e máximo configurados.
         """
-        return self.tempo_servico_min + (self.tempo_servico_max - self.tempo_servico_min) * self.gerador.ProximoAleatorio()
+        return self.tempo_servico_min + self.faixa_servico * self.gerador.ProximoAleatorio()
 
     def gerar_tempo_chegada(self, tempo_atual: float) -> float:
         """
         Gera o próximo tempo de chegada.
         Se a fila não tem chegadas próprias (min=max=0), retorna infinito.
         """
-        if self.tempo_chegada_min == 0 and self.tempo_chegada_max == 0:
+        if not self.tem_chegadas:
             return float('inf')
-        return tempo_atual + self.tempo_chegada_min + (self.tempo_chegada_max - self.tempo_chegada_min) * self.gerador.ProximoAleatorio()
+        return tempo_atual + self.tempo_chegada_min + self.faixa_chegada * self.gerador.ProximoAleatorio()
+
+    def atualizar_tempo_em_estado(self, tempo_atual: float):
+        """
+        Acumula no estado atual o tempo decorrido desde o último evento desta
+        fila. Deve ser chamado antes de qualquer mudança de estado; o estado
+        de uma fila só muda em eventos que a afetam, então o acúmulo
+        preguiçoso é equivalente à varredura de todas as filas a cada evento.
+        Estados acima de estado_maximo são acumulados no último índice.
+        """
+        self.tempo_em_estado[min(len(self.fila) + self.ocupados, self.estado_maximo)] += tempo_atual - self.ultimo_tempo_evento
+        self.ultimo_tempo_evento = tempo_atual
 
-    def obter_proxima_fila(self) -> Optional[str]:
+    def obter_proxima_fila(self) -> Optional[int]:
         """
-        Determina para qual fila o cliente será direcionado após o serviço.
-        Por enquanto, sempre retorna a primeira opção de roteamento.
+        Sorteia o índice da fila para onde o cliente será direcionado após o
+        serviço, segundo as probabilidades de roteamento da configuração.
+        Retorna None quando o cliente sai do sistema (sem roteamento ou
+        probabilidade restante da CDF).
         """
-        if not self.roteamento:
+        if not self.destinos_roteamento:
             return None
-        return list(self.roteamento[0].keys())[0]
+        indice = np.searchsorted(self.cdf_roteamento, self.gerador.ProximoAleatorio(), side='right')
+        if indice >= len(self.destinos_roteamento):
+            return None
+        return self.destinos_roteamento[indice]
 
 class SimuladorRede:
     """
     Classe principal que gerencia a simulação da rede de filas.
     Coordena o fluxo de clientes entre as filas e coleta estatísticas.
     """
-    def __init__(self, arquivo_config: str, num_eventos: int = 100000):
-        # Carrega a configuração da rede do arquivo YAML
-        with open(arquivo_config, 'r') as f:
-            self.config = yaml.safe_load(f)
-        
+    def __init__(self, arquivo_config, num_eventos: int = 100000, verboso: bool = False, seed: int = 1):
+        # Carrega a configuração da rede do arquivo YAML; um dicionário já
+        # carregado também é aceito (usado pelas sub-simulações paralelas)
+        if isinstance(arquivo_config, dict):
+            self.config = arquivo_config
+        else:
+            with open(arquivo_config, 'r') as f:
+                self.config = yaml.load(f, Loader=_YamlLoader)
+
         self.num_eventos = num_eventos
+        self.verboso = verboso  # Imprime progresso durante a simulação
+        self.seed = seed  # Semente do gerador compartilhado
         self.relogio = 0  # Tempo atual da simulação
-        self.eventos = []  # Lista de eventos futuros
+        self.eventos = SortedDict()  # Mapa tempo -> deque de eventos futuros
         self.filas: Dict[str, Fila] = {}
         self.contador_clientes = 0
-        
+        # Um único gerador alimenta todas as filas; o lote compilado
+        # amortiza o custo de geração entre todos os sorteios da rede
+        self.gerador = GeradorAleatorio(seed=seed)
+
         # Inicializa todas as filas da rede
         for nome_fila, config_fila in self.config['queues'].items():
-            self.filas[nome_fila] = Fila(nome_fila, config_fila)
-        
+            self.filas[nome_fila] = Fila(nome_fila, config_fila, self.gerador)
+
+        # Identificação por índice inteiro no caminho quente: acessar uma
+        # lista por índice é mais barato que hash de string a cada evento
+        self.lista_filas: List[Fila] = list(self.filas.values())
+        self.indice_filas: Dict[str, int] = {nome: i for i, nome in enumerate(self.filas)}
+        # Resolve os destinos de roteamento (nomes do YAML) para índices
+        for fila in self.lista_filas:
+            fila.destinos_roteamento = [self.indice_filas[nome] for nome in fila.destinos_roteamento]
+
         # Agenda as chegadas iniciais para filas que têm taxa de chegada
-        for nome_fila, fila in self.filas.items():
-            if fila.tempo_chegada_min > 0 or fila.tempo_chegada_max > 0:
-                self.agendar_evento("chegada", fila.gerar_tempo_chegada(2.0), nome_fila)
+        for indice_fila, fila in enumerate(self.lista_filas):
+            if fila.tem_chegadas:
+                self.agendar_evento(CHEGADA, fila.gerar_tempo_chegada(2.0), indice_fila)
 
-    def agendar_evento(self, tipo_evento: str, tempo: float, nome_fila: str, cliente: Optional[Cliente] = None):
+    def agendar_evento(self, tipo_evento: int, tempo: float, indice_fila: int, cliente: Optional[Cliente] = None, servidor: Optional[int] = None):
         """
         Agenda um novo evento para ser processado no futuro.
-        Os eventos são ordenados por tempo para garantir o processamento na ordem correta.
+        Os eventos são agrupados por tempo em um SortedDict de deques: eventos
+        com o mesmo tempo compartilham um balde e saem na ordem de inserção,
+        sem custo de reordenação e sem comparar objetos Cliente.
         """
-        self.eventos.append((tempo, tipo_evento, nome_fila, cliente))
-        self.eventos.sort()
+        balde = self.eventos.get(tempo)
+        if balde is None:
+            balde = self.eventos[tempo] = deque()
+        balde.append((tipo_evento, indice_fila, cliente, servidor))
 
-    def processar_chegada(self, nome_fila: str, cliente: Optional[Cliente] = None):
+    def processar_chegada(self, indice_fila: int, cliente: Optional[Cliente] = None):
         """
         Processa a chegada de um cliente em uma fila.
         Se o cliente não for fornecido, cria um novo cliente.
         Se a fila estiver cheia, incrementa o contador de clientes perdidos.
         """
-        fila = self.filas[nome_fila]
-        
+        fila = self.lista_filas[indice_fila]
+        fila.atualizar_tempo_em_estado(self.relogio)
+
         if cliente is None:
             self.contador_clientes += 1
             cliente = Cliente(
                 id=self.contador_clientes,
                 tempo_chegada=self.relogio,
-                fila_atual=nome_fila,
+                fila_atual=indice_fila,
                 proxima_fila=fila.obter_proxima_fila()
             )
         else:
             # Atualiza a fila atual do cliente
-            cliente.fila_atual = nome_fila
+            cliente.fila_atual = indice_fila
             # Determina a próxima fila para onde o cliente será direcionado
             cliente.proxima_fila = fila.obter_proxima_fila()
 
@@ -156,56 +271,50 @@ class SimuladorRede:
         fila.fila.append(cliente)
         
         # Agenda a próxima chegada se esta fila tem taxa de chegada
-        if fila.tempo_chegada_min > 0 or fila.tempo_chegada_max > 0:
-            self.agendar_evento("chegada", fila.gerar_tempo_chegada(self.relogio), nome_fila)
+        if fila.tem_chegadas:
+            self.agendar_evento(CHEGADA, fila.gerar_tempo_chegada(self.relogio), indice_fila)
 
-        # Tenta iniciar o serviço para o cliente recém-chegado
-        for i in range(fila.num_servidores):
-            if fila.servidores[i][0] is None and fila.fila:
-                self.iniciar_servico(nome_fila, i)
+        # Uma chegada libera no máximo um início de serviço
+        if fila.livres and fila.fila:
+            self.iniciar_servico(indice_fila, fila.livres.pop())
 
-    def iniciar_servico(self, nome_fila: str, indice_servidor: int):
+    def iniciar_servico(self, indice_fila: int, indice_servidor: int):
         """
         Inicia o serviço para um cliente em um servidor específico.
         Agenda o evento de partida para o momento em que o serviço será concluído.
         """
-        fila = self.filas[nome_fila]
+        fila = self.lista_filas[indice_fila]
         if fila.fila:
-            cliente = fila.fila.pop(0)
+            cliente = fila.fila.popleft()
             tempo_servico = fila.gerar_tempo_servico()
             fila.servidores[indice_servidor] = (cliente, self.relogio + tempo_servico)
-            self.agendar_evento("partida", self.relogio + tempo_servico, nome_fila, cliente)
+            fila.ocupados += 1
+            self.agendar_evento(PARTIDA, self.relogio + tempo_servico, indice_fila, cliente, indice_servidor)
 
-    def processar_partida(self, nome_fila: str, cliente: Cliente):
+    def processar_partida(self, indice_fila: int, cliente: Cliente, indice_servidor: int):
         """
         Processa a partida de um cliente após o serviço.
         Libera o servidor e direciona o cliente para a próxima fila ou para fora do sistema.
+        O índice do servidor vem no próprio evento, agendado em iniciar_servico.
         """
-        fila = self.filas[nome_fila]
-        
-        # Encontra e libera o servidor
-        for i in range(fila.num_servidores):
-            if fila.servidores[i][0] and fila.servidores[i][0].id == cliente.id:
-                fila.servidores[i] = (None, 0)
-                break
-
-        # Direciona para a próxima fila ou para fora do sistema
-        if cliente.proxima_fila:
-            # Cria uma cópia do cliente para enviar para a próxima fila
-            novo_cliente = Cliente(
-                id=cliente.id,
-                tempo_chegada=self.relogio,
-                fila_atual=cliente.proxima_fila,
-                proxima_fila=None  # Será definido quando chegar à próxima fila
-            )
-            self.processar_chegada(cliente.proxima_fila, novo_cliente)
-        else:
-            pass  # Cliente sai do sistema
+        fila = self.lista_filas[indice_fila]
+        fila.atualizar_tempo_em_estado(self.relogio)
+
+        # Libera diretamente o servidor que atendia o cliente
+        fila.servidores[indice_servidor] = (None, 0)
+        fila.ocupados -= 1
+        fila.livres.append(indice_servidor)
+
+        # Direciona para a próxima fila (reutilizando o mesmo objeto Cliente,
+        # sem alocar uma cópia por salto) ou deixa o cliente sair do sistema
+        if cliente.proxima_fila is not None:
+            cliente.tempo_chegada = self.relogio
+            self.processar_chegada(cliente.proxima_fila, cliente)
 
-        # Tenta iniciar serviço para o próximo cliente
-        for i in range(fila.num_servidores):
-            if fila.servidores[i][0] is None and fila.fila:
-                self.iniciar_servico(nome_fila, i)
+        # Uma partida libera no máximo um servidor; qualquer chegada roteada
+        # acima já tentou iniciar o próprio serviço em processar_chegada
+        if fila.livres and fila.fila:
+            self.iniciar_servico(indice_fila, fila.livres.pop())
 
     def executar(self):
         """
@@ -213,44 +322,143 @@ class SimuladorRede:
         Processa eventos na ordem cronológica e coleta estatísticas.
         """
         print(f"Iniciando simulação da rede com {self.num_eventos} eventos...")
-        
+        self._executar_laco()
+        print("\nResultados da Simulação:")
+        print("=" * 50)
+        self.imprimir_resultados()
+        print(f"\nTempo total de simulação: {self.relogio:.2f}")
+
+    def _executar_laco(self):
+        """
+        Laço de eventos propriamente dito, sem impressão de resultados.
+        Separado de executar para que as sub-simulações paralelas possam
+        rodá-lo diretamente.
+        """
+        # Referências locais evitam buscas repetidas de atributos no laço quente
+        eventos = self.eventos
+        peek_evento = self.eventos.peekitem
+        filas = self.lista_filas
+        processar_chegada = self.processar_chegada
+        processar_partida = self.processar_partida
+        verboso = self.verboso
+
         eventos_processados = 0
-        while eventos_processados < self.num_eventos and self.eventos:
-            self.relogio, tipo_evento, nome_fila, cliente = self.eventos.pop(0)
-            
-            # Atualiza o tempo em estado para todas as filas
-            for fila in self.filas.values():
-                tempo_decorrido = self.relogio - fila.ultimo_tempo_evento
-                # Conta clientes em serviço + clientes na fila
-                num_clientes_na_fila = len(fila.fila)
-                num_clientes_em_servico = sum(1 for s in fila.servidores if s[0] is not None)
-                estado_atual = num_clientes_na_fila + num_clientes_em_servico
-                fila.tempo_em_estado[estado_atual] += tempo_decorrido
-                fila.ultimo_tempo_evento = self.relogio
-
-            if tipo_evento == "chegada":
-                self.processar_chegada(nome_fila, cliente)
-            elif tipo_evento == "partida":
-                self.processar_partida(nome_fila, cliente)
+        while eventos_processados < self.num_eventos and eventos:
+            self.relogio, balde = peek_evento(0)
+            tipo_evento, indice_fila, cliente, servidor = balde.popleft()
+            if not balde:
+                del eventos[self.relogio]
+
+            if tipo_evento == CHEGADA:
+                processar_chegada(indice_fila, cliente)
+            elif tipo_evento == PARTIDA:
+                processar_partida(indice_fila, cliente, servidor)
 
             eventos_processados += 1
-            if eventos_processados % 10000 == 0:
-                print(f"Processados {eventos_processados} eventos. Tempo atual: {self.relogio:.2f}")
+            if verboso and eventos_processados % 10000 == 0:
+                # Escreve sem flush: o buffer é descarregado só ao final,
+                # sem bloquear o laço em E/S
+                sys.stdout.write(f"Processados {eventos_processados} eventos. Tempo atual: {self.relogio:.2f}\n")
 
-        # Imprime os resultados
-        print("\nResultados da Simulação:")
-        print("=" * 50)
+        if verboso:
+            sys.stdout.flush()
+
+        # Descarrega o tempo acumulado desde o último evento de cada fila
+        for fila in filas:
+            fila.atualizar_tempo_em_estado(self.relogio)
+
+    def imprimir_resultados(self):
+        """
+        Imprime a distribuição de estados e os clientes perdidos de cada fila.
+        """
         for nome_fila, fila in self.filas.items():
             print(f"\nFila: {nome_fila} ({fila.tipo})")
             print(f"Clientes perdidos: {fila.clientes_perdidos}")
             print("Distribuição de estados:")
-            tempo_total = sum(fila.tempo_em_estado.values())
-            for estado, tempo in sorted(fila.tempo_em_estado.items()):
-                porcentagem = (tempo / tempo_total * 100) if tempo_total > 0 else 0
+            tempo_total = fila.tempo_em_estado.sum()
+            for estado in np.nonzero(fila.tempo_em_estado)[0]:
+                porcentagem = (fila.tempo_em_estado[estado] / tempo_total * 100) if tempo_total > 0 else 0
                 print(f"Estado {estado}: {porcentagem:.2f}%")
-        
-        print(f"\nTempo total de simulação: {self.relogio:.2f}")
+
+    def _componentes_conexos(self) -> List[List[str]]:
+        """
+        Particiona as filas nos componentes fracamente conexos do grafo de
+        roteamento. Filas em componentes distintos nunca trocam clientes,
+        então cada componente pode ser simulado de forma independente.
+        """
+        # Grafo não-direcionado induzido pelas arestas de roteamento
+        vizinhos: Dict[str, set] = {nome: set() for nome in self.config['queues']}
+        for nome, config_fila in self.config['queues'].items():
+            for opcao in config_fila.get('routing', []) or []:
+                for destino in opcao:
+                    vizinhos[nome].add(destino)
+                    vizinhos[destino].add(nome)
+
+        componentes = []
+        visitadas = set()
+        for nome in vizinhos:
+            if nome in visitadas:
+                continue
+            componente = []
+            pendentes = deque([nome])
+            visitadas.add(nome)
+            while pendentes:
+                atual = pendentes.popleft()
+                componente.append(atual)
+                for vizinho in vizinhos[atual]:
+                    if vizinho not in visitadas:
+                        visitadas.add(vizinho)
+                        pendentes.append(vizinho)
+            componentes.append(componente)
+        return componentes
+
+    def executar_paralelo(self):
+        """
+        Executa a simulação particionando a rede em componentes independentes
+        do grafo de roteamento, um laço de eventos por componente, rodando em
+        paralelo via processos (threads serializariam no GIL, já que o laço é
+        Python puro). Como nenhum cliente cruza componentes, não há mensagens
+        entre os laços e o resultado de cada fila é o mesmo de uma simulação
+        isolada do seu componente. Redes com um único componente (como a
+        configuração de exemplo) caem na execução sequencial normal.
+        """
+        componentes = self._componentes_conexos()
+        if len(componentes) <= 1:
+            self.executar()
+            return
+
+        total_filas = len(self.config['queues'])
+        sub_simuladores = []
+        for indice, componente in enumerate(componentes):
+            sub_config = {'queues': {nome: self.config['queues'][nome] for nome in componente}}
+            # O orçamento de eventos é repartido proporcionalmente ao
+            # tamanho do componente; cada componente recebe uma semente
+            # distinta para não replicar o mesmo fluxo aleatório
+            sub_eventos = max(1, self.num_eventos * len(componente) // total_filas)
+            sub_simuladores.append(SimuladorRede(sub_config, sub_eventos, seed=self.seed + indice))
+
+        print(f"Iniciando simulação da rede com {self.num_eventos} eventos "
+              f"em {len(componentes)} componentes independentes...")
+        # Cada processo devolve seu sub-simulador já executado; o pai só
+        # imprime os resultados
+        with ProcessPoolExecutor(max_workers=len(sub_simuladores)) as executor:
+            sub_simuladores = list(executor.map(_executar_sub_simulacao, sub_simuladores))
+
+        print("\nResultados da Simulação:")
+        print("=" * 50)
+        for sub in sub_simuladores:
+            sub.imprimir_resultados()
+        print(f"\nTempo total de simulação: {max(sub.relogio for sub in sub_simuladores):.2f}")
+
+def _executar_sub_simulacao(simulador: SimuladorRede) -> SimuladorRede:
+    """
+    Executa o laço de eventos de uma sub-simulação em um processo filho e
+    devolve o simulador (com suas estatísticas) ao processo pai.
+    Função de módulo para poder ser enviada ao ProcessPoolExecutor.
+    """
+    simulador._executar_laco()
+    return simulador
 
 if __name__ == "__main__":
     simulador = SimuladorRede("configuracao_rede.yml")
-    simulador.executar() 
\ No newline at end of file
+    simulador.executar_paralelo()
\ No newline at end of file